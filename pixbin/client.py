@@ -5,12 +5,41 @@ This module contains the PixbinClient class and related exceptions.
 For usage examples, see the package docstring: help(pixbin)
 """
 
+import asyncio
+import contextlib
+import hashlib
+import hmac
 import io
+import json
 import mimetypes
+import os
+import random
 import requests
+import socket
+import ssl
+import struct
 import time
+import urllib3
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, BinaryIO, Union, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_environ_proxies
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 
 # Optional PIL for dimension extraction
 try:
@@ -20,6 +49,27 @@ try:
 except ImportError:
     HAS_PIL = False
 
+# Optional httpx (with h2) for HTTP/2 multiplexing
+try:
+    import h2  # noqa: F401
+    import httpx
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# Optional orjson for faster JSON encoding and decoding
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 
 class PixbinError(Exception):
     """Base exception for Pixbin SDK errors."""
@@ -45,6 +95,257 @@ class PixbinUploadError(PixbinError):
     pass
 
 
+# Keep-alive connections kept per host (requests defaults to 10)
+POOL_SIZE = 32
+
+# Signed transformation paths memoized per client
+SIGNED_PATH_CACHE_SIZE = 4096
+
+# Transient gateway errors retried by the transport layer
+RETRY_STATUSES = (502, 503, 504)
+
+# Longest Retry-After honoured by transport retries, in seconds
+RETRY_AFTER_MAX = 30.0
+
+# urllib3 defaults (TCP_NODELAY) plus keepalive probes for idle pooled sockets
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
+
+# Content types for common image extensions, checked before mimetypes
+# (whose first lookup reads the system mime.types files)
+IMAGE_CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".avif": "image/avif",
+    ".heic": "image/heic",
+}
+
+# First delay of the status polling backoff, in seconds
+POLL_BACKOFF_BASE = 0.1
+
+
+def _guess_content_type(filename: str) -> str:
+    """Guess the Content-Type of an upload from its filename."""
+    extension = os.path.splitext(filename)[1].lower()
+    return (
+        IMAGE_CONTENT_TYPES.get(extension)
+        or mimetypes.guess_type(filename)[0]
+        or "application/octet-stream"
+    )
+
+
+def _backoff_delay(attempt: int, base: float, cap: float = float("inf")) -> float:
+    """Exponential backoff with full jitter, capped at cap seconds."""
+    return random.uniform(0, min(cap, base * 2 ** min(attempt, 32)))
+
+
+def _retry_after(headers: Mapping[str, str], cap: float) -> Optional[float]:
+    """Seconds requested by a numeric Retry-After header, clamped to cap."""
+    try:
+        delay = float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if delay != delay:  # NaN
+        return None
+    return min(cap, max(0.0, delay))
+
+
+def _variant_retry_delay(
+    headers: Mapping[str, str], attempt: int, retry_delay: float
+) -> float:
+    """Delay before re-requesting a 202 variant: Retry-After or jittered backoff."""
+    # Never wait longer than the backoff window for this attempt
+    cap = retry_delay * 2 ** min(attempt, 32)
+    delay = _retry_after(headers, cap)
+    if delay is None:
+        delay = _backoff_delay(attempt, retry_delay)
+    return delay
+
+
+def _in_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# JPEG start-of-frame markers (DHT, JPG and DAC share the range but are not)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_image_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from PNG, JPEG, GIF or WebP headers.
+
+    Reads only the bytes needed to locate the dimensions. Returns None for
+    other formats or malformed headers.
+    """
+    start = f.tell()
+    head = f.read(30)
+
+    if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+        if len(head) < 24:
+            return None
+        size = struct.unpack_from(">II", head, 16)
+    elif head[:6] in (b"GIF87a", b"GIF89a"):
+        if len(head) < 10:
+            return None
+        size = struct.unpack_from("<HH", head, 6)
+    elif head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) == 30:
+        size = _webp_size(head)
+    elif head[:2] == b"\xff\xd8":
+        f.seek(start + 2)
+        size = _jpeg_size(f)
+    else:
+        return None
+
+    if size and size[0] > 0 and size[1] > 0:
+        return (size[0], size[1])
+    return None
+
+
+def _webp_size(head: bytes) -> Optional[Tuple[int, int]]:
+    """Read dimensions from the first chunk of a WebP file."""
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack_from("<HH", head, 26)
+        return (width & 0x3FFF, height & 0x3FFF)
+    elif chunk == b"VP8L" and head[20] == 0x2F:
+        (bits,) = struct.unpack_from("<I", head, 21)
+        return ((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    elif chunk == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return (width, height)
+    return None
+
+
+def _jpeg_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Walk JPEG segments up to the first start-of-frame header."""
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+
+        code = marker[1]
+        while code == 0xFF:  # Fill bytes
+            byte = f.read(1)
+            if not byte:
+                return None
+            code = byte[0]
+
+        if code == 0x01 or 0xD0 <= code <= 0xD7:  # Standalone markers
+            continue
+        if code in (0xD9, 0xDA):  # End of image or scan before a frame
+            return None
+
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        (length,) = struct.unpack(">H", segment)
+
+        if code in _JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack_from(">xHH", frame)
+            return (width, height)
+
+        if length < 2:
+            return None
+        f.seek(length - 2, io.SEEK_CUR)
+
+
+class _JitteredRetry(Retry):
+    """Retry policy with jittered exponential backoff and bounded Retry-After."""
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+    def get_retry_after(self, response) -> Optional[float]:
+        # urllib3 would sleep for however long the server asks
+        return _retry_after(response.headers, RETRY_AFTER_MAX)
+
+
+class _FileUpload(NamedTuple):
+    """Data source and metadata for a pending upload."""
+
+    filename: str
+    source: Union[Path, BinaryIO]
+    offset: int  # Start of the image data within a file-like source
+    file_size: int
+    content_type: str
+
+
+class _PixbinAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that shares one preloaded SSLContext across connections.
+
+    urllib3 otherwise loads the CA bundle again for every new connection.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        # Custom CA bundles and client certs keep requests' own handling
+        if verify is True and cert is None:
+            pool_kwargs["ssl_context"] = self._ssl_context
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        # The shared context already trusts the default CA bundle
+        if getattr(conn, "conn_kw", {}).get("ssl_context") is self._ssl_context:
+            conn.ca_certs = None
+
+
+def _requests_error(error: urllib3.exceptions.HTTPError) -> requests.RequestException:
+    """Translate a urllib3 error into the exception requests raises for it."""
+    exceptions = urllib3.exceptions
+    # Exhausted retries wrap the underlying failure
+    reason = error.reason if isinstance(error, exceptions.MaxRetryError) else error
+
+    if isinstance(reason, exceptions.ConnectTimeoutError) and not isinstance(
+        reason, exceptions.NewConnectionError
+    ):
+        return requests.exceptions.ConnectTimeout(error)
+    elif isinstance(error, exceptions.ReadTimeoutError):
+        return requests.exceptions.ReadTimeout(error)
+    elif isinstance(reason, exceptions.ResponseError):
+        return requests.exceptions.RetryError(error)
+    elif isinstance(reason, exceptions.ProxyError):
+        return requests.exceptions.ProxyError(error)
+    elif isinstance(reason, exceptions.SSLError):
+        return requests.exceptions.SSLError(error)
+    return requests.exceptions.ConnectionError(error)
+
+
+def _create_ssl_context(ca_bundle: str = DEFAULT_CA_BUNDLE_PATH) -> ssl.SSLContext:
+    """Create an SSLContext trusting the given CA bundle file or directory."""
+    context = create_urllib3_context()
+    if os.path.isdir(ca_bundle):
+        context.load_verify_locations(capath=ca_bundle)
+    else:
+        context.load_verify_locations(ca_bundle)
+    return context
+
+
 class PixbinClient:
     """
     Pixbin API client for uploading and transforming images.
@@ -53,61 +354,307 @@ class PixbinClient:
         api_token: Your API token (generate in account settings)
         base_url: Base URL of Pixbin API (default: https://pixbin.net)
         timeout: Request timeout in seconds (default: 30)
+        max_retries: Transport retries on connection errors and 502/503/504
+            responses. With ``http2=True`` only failed connects are retried
+            (default: 3)
+        http2: Send API calls and downloads over HTTP/2 using httpx
+            (requires ``pixbin[http2]``, default: False)
+        direct_gets: Send status polls and variant downloads straight through
+            urllib3 while ``session`` keeps its default configuration. Proxy
+            and CA bundle environment variables are read once, at
+            construction. Set False to route them through ``session``
+            (default: True)
     """
 
     def __init__(
-        self, api_token: str, base_url: str = "https://pixbin.net", timeout: int = 30
+        self,
+        api_token: str,
+        base_url: str = "https://pixbin.net",
+        timeout: int = 30,
+        max_retries: int = 3,
+        http2: bool = False,
+        direct_gets: bool = True,
     ):
         self.api_token = api_token
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            }
+        self.max_retries = max_retries
+        self._ssl_context = _create_ssl_context()
+        # Only idempotent API calls are retried; a repeated upload/start
+        # would create a duplicate image record.
+        self.session = self._build_session(["GET"])
+        # Content-Type is left to each request; requests sets it for json=
+        self.session.headers["Authorization"] = f"Bearer {api_token}"
+        # Baseline for _session_is_default, and the headers the urllib3 pool sends
+        self._session_headers = dict(self.session.headers)
+        self._session_adapters = dict(self.session.adapters)
+        # Presigned S3 uploads and signed transformation URLs must not carry
+        # the API token, so they get their own pooled sessions.
+        self._s3_session = self._build_session(["POST"])
+        self._public_session = self._build_session(["GET"])
+        # Headers requests sends on public GETs, reused by the urllib3 pool
+        self._public_headers = dict(requests.utils.default_headers())
+        # Extracts dimensions while the S3 upload is in flight
+        self._dim_executor = ThreadPoolExecutor(max_workers=2)
+
+        self._httpx = None
+        self._httpx_public = None
+        if http2:
+            if not HAS_HTTP2:
+                raise PixbinError(
+                    "HTTP/2 support requires httpx: pip install 'pixbin[http2]'"
+                )
+            self._httpx = self._httpx_client(headers=self._auth_headers())
+            # Signed transformation URLs are fetched without the API token
+            self._httpx_public = self._httpx_client()
+
+        # Status polls and variant downloads skip requests' per-call overhead
+        # and go straight to urllib3, unless HTTP/2 or a proxy is in use
+        self._pool = None
+        if (
+            direct_gets
+            and self._httpx is None
+            and not get_environ_proxies(self.base_url)
+        ):
+            self._pool = self._build_pool()
+
+    def close(self):
+        """Close pooled connections and stop background threads."""
+        self.session.close()
+        self._s3_session.close()
+        self._public_session.close()
+        if self._httpx is not None:
+            self._httpx.close()
+            self._httpx_public.close()
+        if self._pool is not None:
+            self._pool.clear()
+        self._dim_executor.shutdown()
+
+    def __enter__(self) -> "PixbinClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def api_token(self) -> str:
+        """API token used for authentication and URL signing."""
+        return self._api_token
+
+    @api_token.setter
+    def api_token(self, value: str):
+        self._api_token = value
+        # Key the HMAC once; signatures copy this state instead of rehashing
+        # the padded key on every call
+        self._hmac_template = hmac.new(value.encode(), digestmod=hashlib.sha256)
+        # Fresh cache so paths signed with a previous token are never reused.
+        # A plain dict rather than lru_cache on a bound method, which would
+        # keep the client alive in a reference cycle.
+        self._signed_paths: Dict[Tuple[str, str], str] = {}
+
+        # Keep clients built with the token in their default headers in step;
+        # they do not exist yet while __init__ sets the initial token
+        if "session" in self.__dict__:
+            self.session.headers["Authorization"] = f"Bearer {value}"
+            self._session_headers["Authorization"] = f"Bearer {value}"
+        if self.__dict__.get("_httpx") is not None:
+            self._httpx.headers["Authorization"] = f"Bearer {value}"
+
+    def _build_retry(self, retry_methods: Iterable[str]) -> Retry:
+        """Create the transport retry policy for the given HTTP methods."""
+        return _JitteredRetry(
+            total=self.max_retries,
+            # Read timeouts surface as requests.ReadTimeout after one timeout,
+            # as with requests' default retry policy
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(retry_methods),
+            respect_retry_after_header=True,
+            # Hand the last response back so _handle_errors can report it
+            raise_on_status=False,
+        )
+
+    def _build_session(self, retry_methods: Iterable[str]) -> requests.Session:
+        """Create a session with a sized connection pool and retry policy."""
+        adapter = _PixbinAdapter(
+            self._ssl_context,
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=self._build_retry(retry_methods),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _build_pool(self) -> urllib3.PoolManager:
+        """Create a urllib3 pool honouring the CA bundle variables requests uses."""
+        ca_bundle = (
+            os.environ.get("REQUESTS_CA_BUNDLE")
+            or os.environ.get("CURL_CA_BUNDLE")
+            or DEFAULT_CA_BUNDLE_PATH
+        )
+        ssl_context = (
+            self._ssl_context
+            if ca_bundle == DEFAULT_CA_BUNDLE_PATH
+            else _create_ssl_context(ca_bundle)
+        )
+        return urllib3.PoolManager(
+            num_pools=4,
+            maxsize=POOL_SIZE,
+            retries=self._build_retry(["GET"]),
+            socket_options=SOCKET_OPTIONS,
+            ssl_context=ssl_context,
+        )
+
+    def _raw_get(
+        self, url: str, authenticated: bool
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """
+        Make a lightweight GET request.
+
+        Returns (status_code, headers, body) tuple.
+        """
+        if self._pool is None or (authenticated and not self._session_is_default()):
+            if self._httpx is not None:
+                client = self._httpx if authenticated else self._httpx_public
+            else:
+                client = self.session if authenticated else self._public_session
+            response = client.get(url, timeout=self.timeout)
+            return response.status_code, response.headers, response.content
+
+        # Same User-Agent and Accept-Encoding as the requests sessions
+        headers = self._session_headers if authenticated else self._public_headers
+        try:
+            response = self._pool.request(
+                "GET", url, headers=headers, timeout=self.timeout
+            )
+        except urllib3.exceptions.HTTPError as e:
+            # Same exception types as the requests-based calls
+            raise _requests_error(e) from e
+        return response.status, response.headers, response.data
+
+    def _session_is_default(self) -> bool:
+        """Whether session still has the configuration the urllib3 pool mirrors."""
+        session = self.session
+        return (
+            session.trust_env
+            and session.verify is True
+            and session.cert is None
+            and session.auth is None
+            and not session.proxies
+            and not session.params
+            and not session.cookies
+            and not any(session.hooks.values())
+            and session.headers == self._session_headers
+            and session.adapters == self._session_adapters
+        )
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """Authorization header for API requests."""
+        return {"Authorization": f"Bearer {self.api_token}"}
+
+    def _httpx_limits(self) -> "httpx.Limits":
+        """Connection limits shared by the sync and async httpx clients."""
+        return httpx.Limits(
+            max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE
+        )
+
+    def _httpx_client(self, **kwargs) -> "httpx.Client":
+        """Create an HTTP/2 client that retries failed connects (not 5xx)."""
+        return httpx.Client(
+            http2=True,
+            timeout=self.timeout,
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=True, limits=self._httpx_limits(), retries=self.max_retries
+            ),
+            **kwargs,
+        )
+
+    def _async_client(self, **kwargs) -> "httpx.AsyncClient":
+        """Create an HTTP/2 async client for concurrent requests."""
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True, limits=self._httpx_limits(), retries=self.max_retries
+            ),
+            **kwargs,
         )
 
     def _get(self, endpoint: str, **kwargs) -> requests.Response:
         """Make GET request."""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.get(url, timeout=self.timeout, **kwargs)
+        client = self._httpx or self.session
+        response = client.get(url, timeout=self.timeout, **kwargs)
         self._handle_errors(response)
         return response
 
     def _post(self, endpoint: str, **kwargs) -> requests.Response:
         """Make POST request."""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.post(url, timeout=self.timeout, **kwargs)
+        client = self._httpx or self.session
+        if "json" in kwargs:
+            # Serialize ourselves so orjson is used when available
+            body_arg = "data" if self._httpx is None else "content"
+            kwargs[body_arg] = _dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Type": "application/json",
+            }
+        response = client.post(url, timeout=self.timeout, **kwargs)
         self._handle_errors(response)
         return response
 
     def _handle_errors(self, response: requests.Response):
         """Handle HTTP errors."""
-        if response.status_code == 401:
-            raise PixbinAuthError(f"Authentication failed: {response.text}")
-        elif response.status_code == 413:
-            raise PixbinQuotaError(f"Quota exceeded: {response.text}")
-        elif response.status_code >= 400:
+        self._check_status(response.status_code, response.content)
+
+    def _check_status(self, status_code: int, body: bytes):
+        """Raise the matching exception for an HTTP error status."""
+        if status_code < 400:
+            return
+
+        text = body.decode("utf-8", "replace")
+        if status_code == 401:
+            raise PixbinAuthError(f"Authentication failed: {text}")
+        elif status_code == 413:
+            raise PixbinQuotaError(f"Quota exceeded: {text}")
+        else:
             try:
-                error_data = response.json()
-                error_msg = error_data.get("error", response.text)
+                error_data = _loads(body)
+                error_msg = error_data.get("error", text)
             except Exception:
-                error_msg = response.text
-            raise PixbinError(f"API error ({response.status_code}): {error_msg}")
+                error_msg = text
+            raise PixbinError(f"API error ({status_code}): {error_msg}")
 
-    def _extract_dimensions(self, file_data: bytes) -> Tuple[int, int]:
+    def _extract_dimensions(self, f: BinaryIO) -> Tuple[int, int]:
         """
-        Extract image dimensions from file data using PIL.
+        Extract image dimensions from an open file.
 
-        Returns (width, height) tuple, or (0, 0) if extraction fails.
+        PNG, JPEG, GIF and WebP headers are parsed directly; other formats
+        fall back to PIL. Only the image header is read. Returns
+        (width, height) tuple, or (0, 0) if extraction fails.
         """
+        try:
+            start = f.tell()
+            size = _read_image_size(f)
+        except Exception:
+            return (0, 0)
+        if size:
+            return size
+
         if not HAS_PIL:
             return (0, 0)
 
+        # Image.open is lazy and reads straight from f; draft() is avoided
+        # since it makes JPEG report the reduced (scaled) size
         try:
-            with PILImage.open(io.BytesIO(file_data)) as img:
+            f.seek(start)
+            with PILImage.open(f) as img:
                 return img.size  # (width, height)
         except Exception:
             return (0, 0)
@@ -129,7 +676,7 @@ class PixbinClient:
             caption: Optional caption for the image
             private: Whether image should be private (default: False)
             retention_hours: Retention period (-1 for permanent, default)
-            poll_interval: Seconds between status polls (default: 1.0)
+            poll_interval: Maximum seconds between status polls (default: 1.0)
             max_wait: Maximum seconds to wait for processing (default: 60)
 
         Returns:
@@ -145,7 +692,100 @@ class PixbinClient:
             >>> image_id = client.upload_file("photo.jpg", caption="My photo")
             >>> print(f"Uploaded: {image_id}")
         """
-        # Open file and get metadata
+        upload = self._read_file(file_path)
+        dimensions = self._submit_dimensions(upload)
+        image_id, upload_url, upload_fields = self._start_upload(
+            upload, caption, private, retention_hours
+        )
+        self._upload_to_s3(upload, upload_url, upload_fields)
+        self._complete_upload(image_id, dimensions.result())
+
+        # Poll for completion
+        if max_wait > 0:
+            self._wait_for_completion(image_id, poll_interval, max_wait)
+
+        return image_id
+
+    def upload_files_batch(
+        self,
+        file_paths: List[Union[str, Path, BinaryIO]],
+        caption: str = "",
+        private: bool = False,
+        retention_hours: int = -1,
+        poll_interval: float = 1.0,
+        max_wait: int = 60,
+        max_workers: int = 8,
+    ) -> List[str]:
+        """
+        Upload several image files concurrently.
+
+        Each phase of the 3-phase flow runs in parallel across all files,
+        and processing status is polled for all of them together.
+
+        Args:
+            file_paths: Paths to image files or file-like objects
+            caption: Optional caption applied to every image
+            private: Whether images should be private (default: False)
+            retention_hours: Retention period (-1 for permanent, default)
+            poll_interval: Maximum seconds between status polls (default: 1.0)
+            max_wait: Maximum seconds to wait for processing (default: 60)
+            max_workers: Number of concurrent uploads (default: 8)
+
+        Returns:
+            Image IDs, in the same order as file_paths
+
+        Raises:
+            PixbinUploadError: If any upload fails
+            PixbinQuotaError: If quota is exceeded
+            PixbinAuthError: If authentication fails
+
+        Example:
+            >>> image_ids = client.upload_files_batch(["a.jpg", "b.png"])
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            uploads = list(executor.map(self._read_file, file_paths))
+            dimensions = [self._submit_dimensions(upload) for upload in uploads]
+
+            # Phase 1: Start all uploads
+            started = list(
+                executor.map(
+                    lambda upload: self._start_upload(
+                        upload, caption, private, retention_hours
+                    ),
+                    uploads,
+                )
+            )
+            image_ids = [image_id for image_id, _, _ in started]
+
+            # Phase 2: Upload all files to S3
+            list(
+                executor.map(
+                    lambda upload, start: self._upload_to_s3(
+                        upload, start[1], start[2]
+                    ),
+                    uploads,
+                    started,
+                )
+            )
+
+            # Phase 3: Complete all uploads
+            list(
+                executor.map(
+                    lambda image_id, dims: self._complete_upload(
+                        image_id, dims.result()
+                    ),
+                    image_ids,
+                    dimensions,
+                )
+            )
+
+        if max_wait > 0:
+            self._wait_for_completion_many(image_ids, poll_interval, max_wait)
+
+        return image_ids
+
+    def _read_file(self, file_path: Union[str, Path, BinaryIO]) -> _FileUpload:
+        """Collect file metadata for upload without reading its contents."""
         if isinstance(file_path, (str, Path)):
             file_path = Path(file_path)
             if not file_path.exists():
@@ -153,89 +793,200 @@ class PixbinClient:
 
             filename = file_path.name
             file_size = file_path.stat().st_size
-            content_type = (
-                mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
-            )
+            content_type = _guess_content_type(filename)
+            return _FileUpload(filename, file_path, 0, file_size, content_type)
 
-            with open(file_path, "rb") as f:
-                file_data = f.read()
-        else:
-            # File-like object
-            filename = getattr(file_path, "name", "image.jpg")
-            file_data = file_path.read()
-            file_size = len(file_data)
-            content_type = (
-                mimetypes.guess_type(filename)[0] or "application/octet-stream"
-            )
+        # File-like object
+        filename = getattr(file_path, "name", "image.jpg")
+        content_type = _guess_content_type(filename)
 
-        # Phase 1: Start upload
+        # Data is read again for S3 and dimension extraction, so buffer
+        # streams that cannot be rewound
+        seekable = getattr(file_path, "seekable", None)
+        if not (seekable and seekable()):
+            file_path = io.BytesIO(file_path.read())
+
+        offset = file_path.tell()
+        file_size = file_path.seek(0, io.SEEK_END) - offset
+        file_path.seek(offset)
+
+        return _FileUpload(filename, file_path, offset, file_size, content_type)
+
+    def _open_source(self, upload: _FileUpload) -> ContextManager[BinaryIO]:
+        """Open the upload source, positioned at the start of the image data."""
+        if isinstance(upload.source, Path):
+            return open(upload.source, "rb")
+
+        # Caller owns file-like objects, so leave them open
+        upload.source.seek(upload.offset)
+        return contextlib.nullcontext(upload.source)
+
+    def _start_upload(
+        self,
+        upload: _FileUpload,
+        caption: str,
+        private: bool,
+        retention_hours: int,
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Phase 1: Register the upload with the API.
+
+        Returns (image_id, upload_url, upload_fields) tuple.
+        """
         start_response = self._post(
             "/api/v1/upload/start",
             json={
-                "filename": filename,
-                "content_type": content_type,
-                "file_size": file_size,
+                "filename": upload.filename,
+                "content_type": upload.content_type,
+                "file_size": upload.file_size,
                 "caption": caption,
                 "private": private,
                 "retention_hours": retention_hours,
             },
         )
 
-        start_data = start_response.json()
+        start_data = _loads(start_response.content)
         if start_data.get("status") != "success":
             raise PixbinUploadError(f"Upload start failed: {start_data}")
 
-        image_id = start_data["data"]["image_id"]
-        upload_url = start_data["data"]["upload_url"]
-        upload_fields = start_data["data"]["upload_fields"]
+        return (
+            start_data["data"]["image_id"],
+            start_data["data"]["upload_url"],
+            start_data["data"]["upload_fields"],
+        )
 
-        # Phase 2: Upload to S3
+    def _upload_to_s3(
+        self, upload: _FileUpload, upload_url: str, upload_fields: Dict[str, Any]
+    ):
+        """Phase 2: Upload file contents to the presigned S3 URL."""
         try:
-            files = {"file": (filename, file_data, content_type)}
-            s3_response = requests.post(
-                upload_url, data=upload_fields, files=files, timeout=self.timeout
-            )
+            with self._open_source(upload) as f:
+                files = {"file": (upload.filename, f, upload.content_type)}
+                s3_response = self._s3_session.post(
+                    upload_url, data=upload_fields, files=files, timeout=self.timeout
+                )
             s3_response.raise_for_status()
         except requests.RequestException as e:
             raise PixbinUploadError(f"S3 upload failed: {e}")
 
-        # Extract dimensions for immediate availability (enables skeleton layouts)
-        width, height = self._extract_dimensions(file_data)
+    def _submit_dimensions(self, upload: _FileUpload) -> "Future[Tuple[int, int]]":
+        """
+        Start extracting dimensions for immediate availability (enables
+        skeleton layouts).
 
-        # Phase 3: Complete upload with dimensions
-        complete_payload = {"image_id": image_id}
-        if width > 0 and height > 0:
-            complete_payload["width"] = width
-            complete_payload["height"] = height
+        Files on disk are read in the background on their own handle, so
+        extraction overlaps the S3 upload. File-like sources share a read
+        position with the upload and are handled right away.
+        """
+        if isinstance(upload.source, Path):
+            return self._dim_executor.submit(self._source_dimensions, upload)
+
+        future = Future()
+        future.set_result(self._source_dimensions(upload))
+        return future
+
+    def _source_dimensions(self, upload: _FileUpload) -> Tuple[int, int]:
+        """Extract dimensions from the upload source."""
+        with self._open_source(upload) as f:
+            return self._extract_dimensions(f)
+
+    def _complete_upload(self, image_id: str, dimensions: Tuple[int, int]):
+        """Phase 3: Mark the upload complete, sending dimensions if known."""
+        width, height = dimensions
+        complete_payload = (
+            {"image_id": image_id, "width": width, "height": height}
+            if width > 0 and height > 0
+            else {"image_id": image_id}
+        )
 
         complete_response = self._post("/api/v1/upload/complete", json=complete_payload)
 
-        complete_data = complete_response.json()
+        complete_data = _loads(complete_response.content)
         if complete_data.get("status") != "success":
             raise PixbinUploadError(f"Upload completion failed: {complete_data}")
 
-        # Poll for completion
-        if max_wait > 0:
-            self._wait_for_completion(image_id, poll_interval, max_wait)
-
-        return image_id
-
     def _wait_for_completion(self, image_id: str, poll_interval: float, max_wait: int):
         """Wait for image processing to complete."""
-        start_time = time.time()
-        while time.time() - start_time < max_wait:
-            status_data = self.get_status(image_id)
-            processing_status = status_data.get("processing_status")
+        # Bind loop lookups to locals once
+        now, sleep, get_status = time.monotonic, time.sleep, self.get_status
+        deadline = now() + max_wait
+        attempt = 0
+        while now() < deadline:
+            processing_status = get_status(image_id).get("processing_status")
 
             if processing_status == "completed":
                 return
             elif processing_status in ("failed", "expired"):
                 raise PixbinUploadError(f"Processing failed: {processing_status}")
 
-            time.sleep(poll_interval)
+            sleep(_backoff_delay(attempt, POLL_BACKOFF_BASE, poll_interval))
+            attempt += 1
+
+        raise PixbinUploadError(f"Processing timeout after {max_wait}s")
+
+    def _wait_for_completion_many(
+        self, image_ids: List[str], poll_interval: float, max_wait: int
+    ):
+        """Wait for several images to finish processing, one poll tick for all."""
+        # Only poll over HTTP/2 when the client was asked to use it, and never
+        # nest asyncio.run inside a caller's running loop
+        if self._httpx is not None and not _in_event_loop():
+            asyncio.run(
+                self._wait_for_completion_many_async(image_ids, poll_interval, max_wait)
+            )
+            return
+
+        now, sleep, get_status = time.monotonic, time.sleep, self.get_status
+        still_processing = self._still_processing
+        pending = list(image_ids)
+        deadline = now() + max_wait
+        attempt = 0
+        while now() < deadline:
+            pending = still_processing({i: get_status(i) for i in pending})
+            if not pending:
+                return
+
+            sleep(_backoff_delay(attempt, POLL_BACKOFF_BASE, poll_interval))
+            attempt += 1
 
         raise PixbinUploadError(f"Processing timeout after {max_wait}s")
 
+    async def _wait_for_completion_many_async(
+        self, image_ids: List[str], poll_interval: float, max_wait: int
+    ):
+        """Poll all pending images concurrently on one HTTP/2 connection."""
+        now, sleep = time.monotonic, asyncio.sleep
+        get_status_many = self._get_status_many
+        still_processing = self._still_processing
+        pending = list(image_ids)
+        deadline = now() + max_wait
+        attempt = 0
+        async with self._async_client(headers=self._auth_headers()) as client:
+            while now() < deadline:
+                pending = still_processing(await get_status_many(client, pending))
+                if not pending:
+                    return
+
+                await sleep(_backoff_delay(attempt, POLL_BACKOFF_BASE, poll_interval))
+                attempt += 1
+
+        raise PixbinUploadError(f"Processing timeout after {max_wait}s")
+
+    def _still_processing(self, statuses: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Return IDs still being processed, raising if any image failed."""
+        pending = []
+        for image_id, status_data in statuses.items():
+            processing_status = status_data.get("processing_status")
+
+            if processing_status in ("failed", "expired"):
+                raise PixbinUploadError(
+                    f"Processing failed for {image_id}: {processing_status}"
+                )
+            elif processing_status != "completed":
+                pending.append(image_id)
+
+        return pending
+
     def get_status(self, image_id: str) -> Dict[str, Any]:
         """
         Get image processing status.
@@ -251,9 +1002,52 @@ class PixbinClient:
             >>> print(status["processing_status"])  # "completed"
             >>> print(status["width"], status["height"])  # 1920 1080
         """
-        response = self._get(f"/api/v1/image/{image_id}/status")
-        data = response.json()
-        return data.get("data", {})
+        url = f"{self.base_url}/api/v1/image/{image_id}/status"
+        status_code, _, body = self._raw_get(url, authenticated=True)
+        self._check_status(status_code, body)
+        return _loads(body).get("data", {})
+
+    async def get_status_many(self, image_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get processing status for several images concurrently.
+
+        All requests are multiplexed on a single HTTP/2 connection. Requires
+        ``pixbin[http2]``.
+
+        Args:
+            image_ids: Image UUIDs
+
+        Returns:
+            Status dictionaries keyed by image ID
+
+        Example:
+            >>> statuses = await client.get_status_many([id1, id2])
+            >>> print(statuses[id1]["processing_status"])  # "completed"
+        """
+        if not HAS_HTTP2:
+            raise PixbinError(
+                "Concurrent status requires httpx: pip install 'pixbin[http2]'"
+            )
+
+        async with self._async_client(headers=self._auth_headers()) as client:
+            return await self._get_status_many(client, image_ids)
+
+    async def _get_status_many(
+        self, client: "httpx.AsyncClient", image_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch status for all image IDs concurrently on the given client."""
+        responses = await asyncio.gather(
+            *(
+                client.get(f"{self.base_url}/api/v1/image/{image_id}/status")
+                for image_id in image_ids
+            )
+        )
+
+        statuses = {}
+        for image_id, response in zip(image_ids, responses):
+            self._handle_errors(response)
+            statuses[image_id] = _loads(response.content).get("data", {})
+        return statuses
 
     def _generate_signature(self, image_id: str, params: str) -> str:
         """
@@ -261,15 +1055,25 @@ class PixbinClient:
 
         Uses the API token as the signing key.
         """
-        import hmac
-        import hashlib
-
-        message = f"{image_id}:{params}"
-        signature = hmac.new(
-            self.api_token.encode(), message.encode(), hashlib.sha256
-        ).hexdigest()
+        h = self._hmac_template.copy()
+        h.update(image_id.encode())
+        h.update(b":")
+        h.update(params.encode())
         # Return first 16 chars for shorter URLs
-        return signature[:16]
+        return h.hexdigest()[:16]
+
+    def _signed_path(self, image_id: str, params: str) -> str:
+        """Return the signed transformation path, memoized per client."""
+        key = (image_id, params)
+        cache = self._signed_paths
+        path = cache.get(key)
+        if path is None:
+            if len(cache) >= SIGNED_PATH_CACHE_SIZE:
+                # Evict the oldest entry; dicts keep insertion order
+                cache.pop(next(iter(cache), None), None)
+            signature = self._generate_signature(image_id, params)
+            path = cache[key] = f"/api/v1/image/{signature}/{params}/{image_id}"
+        return path
 
     def transform_url(
         self, image_id: str, params: str, include_host: bool = True
@@ -293,13 +1097,37 @@ class PixbinClient:
             >>> print(url)
             https://pixbin.net/api/v1/image/abc123/resize:300x300:fit,.../uuid
         """
-        signature = self._generate_signature(image_id, params)
-        path = f"/api/v1/image/{signature}/{params}/{image_id}"
+        path = self._signed_path(image_id, params)
 
         if include_host:
             return f"{self.base_url}{path}"
         return path
 
+    def transform_urls(
+        self, pairs: List[Tuple[str, str]], include_host: bool = True
+    ) -> List[str]:
+        """
+        Generate signed transformation URLs for many images at once.
+
+        Args:
+            pairs: (image_id, params) tuples
+            include_host: Include full URL (default) or just path
+
+        Returns:
+            Transformation URLs, in the same order as pairs
+
+        Example:
+            >>> urls = client.transform_urls(
+            ...     [(image_id, thumbnail(300, 300)) for image_id in image_ids]
+            ... )
+        """
+        signed_path = self._signed_path
+        if not include_host:
+            return [signed_path(image_id, params) for image_id, params in pairs]
+
+        base_url = self.base_url
+        return [base_url + signed_path(image_id, params) for image_id, params in pairs]
+
     def download_transformed(
         self, image_id: str, params: str, max_retries: int = 3, retry_delay: float = 2.0
     ) -> bytes:
@@ -312,7 +1140,8 @@ class PixbinClient:
             image_id: Image UUID
             params: Transformation parameters
             max_retries: Maximum retry attempts (default: 3)
-            retry_delay: Delay between retries in seconds (default: 2.0)
+            retry_delay: Base delay for jittered exponential backoff between
+                retries, unless the server sends Retry-After (default: 2.0)
 
         Returns:
             Image bytes
@@ -328,21 +1157,109 @@ class PixbinClient:
         url = self.transform_url(image_id, params)
 
         for attempt in range(max_retries):
-            response = requests.get(url, timeout=self.timeout)
+            status_code, headers, body = self._raw_get(url, authenticated=False)
+
+            if status_code == 200:
+                return body
+            elif status_code == 202:
+                # Variant being generated, retry
+                if attempt < max_retries - 1:
+                    time.sleep(_variant_retry_delay(headers, attempt, retry_delay))
+                    continue
+                else:
+                    raise PixbinError(
+                        "Transformation timeout - variant still processing"
+                    )
+            else:
+                self._check_status(status_code, body)
+
+        raise PixbinError("Failed to download transformed image")
+
+    def download_transformed_batch(
+        self,
+        image_id: str,
+        params_list: List[str],
+        max_retries: int = 3,
+        retry_delay: float = 2.0,
+    ) -> List[bytes]:
+        """
+        Download several variants of an image concurrently over HTTP/2.
+
+        All requests are multiplexed on a single connection. Requires
+        ``pixbin[http2]``. When called from a running event loop, variants are
+        downloaded one at a time instead.
+
+        Args:
+            image_id: Image UUID
+            params_list: Transformation parameters, one per variant
+            max_retries: Maximum retry attempts per variant (default: 3)
+            retry_delay: Base delay for jittered exponential backoff between
+                retries, unless the server sends Retry-After (default: 2.0)
+
+        Returns:
+            Image bytes, in the same order as params_list
+
+        Example:
+            >>> small, large = client.download_transformed_batch(
+            ...     image_id,
+            ...     [thumbnail(300, 300), thumbnail(1200, 1200)]
+            ... )
+        """
+        if not HAS_HTTP2:
+            raise PixbinError(
+                "Batch downloads require httpx: pip install 'pixbin[http2]'"
+            )
+
+        if _in_event_loop():
+            # asyncio.run cannot nest inside a running loop
+            return [
+                self.download_transformed(image_id, params, max_retries, retry_delay)
+                for params in params_list
+            ]
+
+        urls = [self.transform_url(image_id, params) for params in params_list]
+        return asyncio.run(self._download_many(urls, max_retries, retry_delay))
+
+    async def _download_many(
+        self, urls: List[str], max_retries: int, retry_delay: float
+    ) -> List[bytes]:
+        """Fetch all URLs concurrently on one HTTP/2 client."""
+        async with self._async_client() as client:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._download_async(client, url, max_retries, retry_delay)
+                        for url in urls
+                    )
+                )
+            )
+
+    async def _download_async(
+        self,
+        client: "httpx.AsyncClient",
+        url: str,
+        max_retries: int,
+        retry_delay: float,
+    ) -> bytes:
+        """Download a single variant, retrying while it is being generated."""
+        for attempt in range(max_retries):
+            response = await client.get(url)
 
             if response.status_code == 200:
                 return response.content
             elif response.status_code == 202:
                 # Variant being generated, retry
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(
+                        _variant_retry_delay(response.headers, attempt, retry_delay)
+                    )
                     continue
                 else:
                     raise PixbinError(
                         "Transformation timeout - variant still processing"
                     )
             else:
-                response.raise_for_status()
+                self._handle_errors(response)
 
         raise PixbinError("Failed to download transformed image")
 
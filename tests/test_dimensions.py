@@ -0,0 +1,132 @@
+"""Tests for the built-in image header parser."""
+
+import io
+import struct
+
+import pytest
+
+from pixbin import PixbinClient
+from pixbin.client import _read_image_size
+
+
+def png(width, height):
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", 13)
+        + b"IHDR"
+        + struct.pack(">II", width, height)
+        + b"\x08\x02\x00\x00\x00"
+    )
+
+
+def gif(width, height, version=b"GIF89a"):
+    return version + struct.pack("<HH", width, height) + b"\x00\x00\x00"
+
+
+def webp(chunk, payload):
+    body = b"WEBP" + chunk + struct.pack("<I", len(payload)) + payload
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def webp_lossy(width, height):
+    # Frame tag, start code, then 14-bit width/height (top bits are scale)
+    return webp(
+        b"VP8 ",
+        b"\x00\x00\x00\x9d\x01\x2a"
+        + struct.pack("<HH", width | 0x4000, height | 0x8000),
+    )
+
+
+def webp_lossless(width, height):
+    bits = (width - 1) | ((height - 1) << 14)
+    return webp(b"VP8L", b"\x2f" + struct.pack("<I", bits) + b"\x00" * 8)
+
+
+def webp_extended(width, height):
+    return webp(
+        b"VP8X",
+        b"\x10\x00\x00\x00"
+        + (width - 1).to_bytes(3, "little")
+        + (height - 1).to_bytes(3, "little"),
+    )
+
+
+def segment(marker, payload):
+    return b"\xff" + bytes([marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def jpeg(width, height, sof=0xC0, prefix=b""):
+    return (
+        b"\xff\xd8"
+        + prefix
+        + segment(0xE0, b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00")
+        + segment(sof, b"\x08" + struct.pack(">HH", height, width) + b"\x03")
+        + b"\xff\xd9"
+    )
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (png(1, 1), (1, 1)),
+        (png(1920, 1080), (1920, 1080)),
+        (gif(37, 21), (37, 21)),
+        (gif(640, 480, version=b"GIF87a"), (640, 480)),
+        (webp_lossy(300, 200), (300, 200)),
+        (webp_lossless(16383, 2), (16383, 2)),
+        (webp_extended(4000, 3001), (4000, 3001)),
+        (jpeg(800, 600), (800, 600)),
+        (jpeg(1024, 768, sof=0xC2), (1024, 768)),
+        # Large APP1 (EXIF) block before the frame header
+        (jpeg(50, 40, prefix=segment(0xE1, b"Exif\x00\x00" + bytes(60000))), (50, 40)),
+        # Fill bytes before a marker
+        (jpeg(10, 20, prefix=b"\xff\xff"), (10, 20)),
+    ],
+)
+def test_reads_dimensions(data, expected):
+    assert _read_image_size(io.BytesIO(data)) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"not an image",
+        # Truncated headers
+        png(100, 100)[:20],
+        png(100, 100)[:23],
+        gif(100, 100)[:8],
+        gif(100, 100)[:9],
+        webp_lossy(100, 100)[:29],
+        b"\xff\xd8",
+        b"\xff\xd8\xff",
+        jpeg(100, 100)[:22],
+        jpeg(100, 100)[:-8],
+        # Malformed headers
+        png(0, 100),
+        webp(b"VP8 ", b"\x00" * 10),
+        webp(b"VP8L", b"\x00" * 10),
+        webp(b"ALPH", b"\x00" * 10),
+        b"\xff\xd8\x00\x00",
+        b"\xff\xd8" + b"\xff\xe0\x00\x01",
+        b"\xff\xd8\xff\xda\x00\x02",
+        jpeg(0, 100),
+    ],
+)
+def test_rejects_truncated_and_malformed(data):
+    assert _read_image_size(io.BytesIO(data)) is None
+
+
+def test_reads_from_current_position():
+    f = io.BytesIO(b"leading bytes" + jpeg(64, 48))
+    f.seek(len(b"leading bytes"))
+    assert _read_image_size(f) == (64, 48)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [png(100, 100)[:20], gif(100, 100)[:9], b"\xff\xd8\xff", b"garbage"],
+)
+def test_extract_dimensions_falls_back_to_zero(data):
+    client = PixbinClient("token")
+    assert client._extract_dimensions(io.BytesIO(data)) == (0, 0)
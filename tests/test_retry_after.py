@@ -0,0 +1,62 @@
+"""Tests for Retry-After handling on 202 variant retries."""
+
+import pytest
+
+from pixbin.client import _retry_after, _variant_retry_delay
+
+
+@pytest.mark.parametrize(
+    "headers, cap, expected",
+    [
+        ({"Retry-After": "2"}, 10.0, 2.0),
+        ({"Retry-After": "0.5"}, 10.0, 0.5),
+        ({"Retry-After": " 3 "}, 10.0, 3.0),
+        ({"Retry-After": "0"}, 10.0, 0.0),
+        # Clamped to the cap
+        ({"Retry-After": "3600"}, 10.0, 10.0),
+        ({"Retry-After": "inf"}, 10.0, 10.0),
+        ({"Retry-After": "1e308"}, 10.0, 10.0),
+        # Negative values never produce a negative sleep
+        ({"Retry-After": "-5"}, 10.0, 0.0),
+        ({"Retry-After": "-inf"}, 10.0, 0.0),
+        # Not usable as a delay
+        ({}, 10.0, None),
+        ({"Retry-After": "nan"}, 10.0, None),
+        ({"Retry-After": ""}, 10.0, None),
+        ({"Retry-After": "soon"}, 10.0, None),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 10.0, None),
+        ({"Retry-After": None}, 10.0, None),
+    ],
+)
+def test_retry_after(headers, cap, expected):
+    assert _retry_after(headers, cap) == expected
+
+
+@pytest.mark.parametrize(
+    "retry_after, attempt, expected",
+    [
+        ("1", 0, 1.0),
+        # Capped at retry_delay * 2 ** attempt
+        ("3600", 0, 2.0),
+        ("3600", 2, 8.0),
+        ("inf", 1, 4.0),
+        ("-1", 0, 0.0),
+    ],
+)
+def test_variant_retry_delay_honours_retry_after(retry_after, attempt, expected):
+    headers = {"Retry-After": retry_after}
+    assert _variant_retry_delay(headers, attempt, retry_delay=2.0) == expected
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Retry-After": "nan"},
+        {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    ],
+)
+@pytest.mark.parametrize("attempt", [0, 1, 3, 100])
+def test_variant_retry_delay_falls_back_to_backoff(headers, attempt):
+    delay = _variant_retry_delay(headers, attempt, retry_delay=2.0)
+    assert 0.0 <= delay <= 2.0 * 2 ** min(attempt, 32)
@@ -0,0 +1,209 @@
+"""Tests for the urllib3 fast path and its fallback to the requests session."""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from requests import exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ProxyError,
+    ReadTimeoutError,
+    ResponseError,
+    SSLError,
+)
+
+from pixbin import PixbinClient
+from pixbin.client import _requests_error
+
+URL = "http://127.0.0.1/api/v1/image/x/status"
+
+
+def retries_exhausted(reason):
+    return MaxRetryError(None, URL, reason)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (
+            retries_exhausted(ConnectTimeoutError("timed out")),
+            exceptions.ConnectTimeout,
+        ),
+        (ReadTimeoutError(None, URL, "timed out"), exceptions.ReadTimeout),
+        # requests reports exhausted read retries as a connection error
+        (
+            retries_exhausted(ReadTimeoutError(None, URL, "timed out")),
+            exceptions.ConnectionError,
+        ),
+        (
+            retries_exhausted(NewConnectionError(None, "refused")),
+            exceptions.ConnectionError,
+        ),
+        (retries_exhausted(ResponseError("too many 503s")), exceptions.RetryError),
+        (retries_exhausted(ProxyError("bad proxy", OSError())), exceptions.ProxyError),
+        (retries_exhausted(SSLError("bad cert")), exceptions.SSLError),
+        (ProtocolError("connection reset"), exceptions.ConnectionError),
+    ],
+)
+def test_requests_error(error, expected):
+    assert type(_requests_error(error)) is expected
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    client = PixbinClient("token", base_url="http://127.0.0.1:1")
+    yield client
+    client.close()
+
+
+def test_session_is_default(client):
+    assert client._session_is_default()
+
+
+def test_token_rotation_keeps_session_default(client):
+    client.api_token = "rotated"
+    assert client._session_is_default()
+
+
+def _mount_adapter(session):
+    session.mount("https://", HTTPAdapter())
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda s: s.headers.update({"X-Trace": "1"}),
+        lambda s: s.headers.update({"User-Agent": "my-app/1.0"}),
+        lambda s: s.headers.pop("Accept-Encoding"),
+        lambda s: setattr(s, "verify", False),
+        lambda s: setattr(s, "verify", "/etc/ssl/custom.pem"),
+        lambda s: setattr(s, "cert", "client.pem"),
+        lambda s: setattr(s, "auth", ("user", "pass")),
+        lambda s: s.proxies.update({"https": "http://proxy:3128"}),
+        lambda s: s.params.update({"sig": "1"}),
+        lambda s: s.cookies.set("session", "1"),
+        lambda s: s.hooks["response"].append(lambda r, **kwargs: r),
+        lambda s: setattr(s, "trust_env", False),
+        _mount_adapter,
+    ],
+)
+def test_session_changes_disable_fast_path(client, change):
+    change(client.session)
+    assert not client._session_is_default()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.seen.append(dict(self.headers))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.seen = []
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def live_client(monkeypatch, server):
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    client = PixbinClient("token", base_url=f"http://127.0.0.1:{server.server_port}")
+    pool_calls = []
+    request = client._pool.request
+
+    def spy(*args, **kwargs):
+        pool_calls.append(kwargs)
+        return request(*args, **kwargs)
+
+    monkeypatch.setattr(client._pool, "request", spy)
+    client.pool_calls = pool_calls
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize(
+    "change, authenticated, uses_pool",
+    [
+        (None, True, True),
+        (None, False, True),
+        (lambda c: setattr(c, "api_token", "rotated"), True, True),
+        (lambda c: c.session.headers.update({"X-Trace": "1"}), True, False),
+        (lambda c: setattr(c.session, "verify", False), True, False),
+        (lambda c: _mount_adapter(c.session), True, False),
+        # Public GETs never go through the API session
+        (lambda c: c.session.headers.update({"X-Trace": "1"}), False, True),
+    ],
+)
+def test_raw_get_chooses_pool_or_session(live_client, change, authenticated, uses_pool):
+    if change is not None:
+        change(live_client)
+    url = f"{live_client.base_url}/api/v1/image/x/status"
+
+    status, _, body = live_client._raw_get(url, authenticated=authenticated)
+
+    assert (status, body) == (200, b"{}")
+    assert bool(live_client.pool_calls) is uses_pool
+
+
+@pytest.mark.parametrize("authenticated", [True, False])
+def test_pool_sends_session_headers(live_client, server, authenticated):
+    url = f"{live_client.base_url}/api/v1/image/x/status"
+    session = live_client.session if authenticated else live_client._public_session
+
+    live_client._raw_get(url, authenticated=authenticated)
+    session.get(url)
+
+    assert live_client.pool_calls
+    via_pool, via_session = server.seen
+    assert via_pool == via_session
+    assert ("Authorization" in via_pool) is authenticated
+
+
+def test_pool_uses_current_timeout(live_client):
+    live_client.timeout = 1.5
+    live_client.get_status("x")
+    assert live_client.pool_calls[0]["timeout"] == 1.5
+
+
+def test_direct_gets_disabled(monkeypatch):
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    with PixbinClient("token", direct_gets=False) as client:
+        assert client._pool is None
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_pool_errors_match_session_errors(monkeypatch):
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    base_url = f"http://127.0.0.1:{_closed_port()}"
+    with PixbinClient("token", base_url=base_url, max_retries=0) as client:
+        assert client._pool is not None
+        with pytest.raises(requests.ConnectionError):
+            client.get_status("x")
+        with pytest.raises(requests.ConnectionError):
+            client.download_original("x")